@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.23 on 2026-10-15 10:12
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+# Django 1.11 cannot express partial indexes. The alert feed almost always asks for undismissed alerts newest first.
+forward = """
+CREATE INDEX alertstate_undismissed_idx ON chroma_core_alertstate (begin DESC) WHERE NOT dismissed;
+"""
+
+backward = """
+DROP INDEX alertstate_undismissed_idx;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chroma_core", "0032_forgetlustreclientjob"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="alertstatebase",
+            index=models.Index(
+                fields=["alert_item_type", "alert_item_id", "dismissed", "-begin"], name="alertstate_item_feed_idx"
+            ),
+        ),
+        migrations.RunSQL(sql=forward, reverse_sql=backward),
+    ]
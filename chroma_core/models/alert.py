@@ -21,6 +21,11 @@ from chroma_core.lib.job import job_log
 class AlertStateBase(SparseModel):
     class Meta:
         unique_together = ("alert_item_type", "alert_item_id", "alert_type", "active")
+        indexes = [
+            models.Index(
+                fields=["alert_item_type", "alert_item_id", "dismissed", "-begin"], name="alertstate_item_feed_idx"
+            )
+        ]
         ordering = ["id"]
         app_label = "chroma_core"
         db_table = "chroma_core_alertstate"
@@ -274,6 +279,47 @@ class AlertStateBase(SparseModel):
         alert_state = cls.high(alert_item, attrs_to_save=kwargs)
         cls.low(alert_item, end_time=alert_state.begin, attrs_to_save=kwargs)
 
+    @classmethod
+    def end_alerts_bulk(cls, alerts, end_time=None):
+        """
+        Lower many active alerts at once. Has the same effect as calling low() for each alert but the alerts are
+        updated with one query and their end events inserted in batches, rather than costing several queries each.
+
+        Like low() only alerts of this class are lowered, call it on AlertState to lower alerts of any type.
+
+        :param alerts: iterable of alerts to lower, any that are not of this class or no longer active are ignored
+        :param end_time: time the alerts ended, defaults to now()
+        :return: list of the end events created
+        """
+        if end_time is None:
+            end_time = timezone.now()
+
+        # Like low(), only lower alerts that are still active.
+        alerts = list(alerts)
+        active_ids = set(
+            cls.objects.filter(id__in=[alert.id for alert in alerts], active=True).values_list("id", flat=True)
+        )
+        alerts = [alert for alert in alerts if alert.id in active_ids]
+
+        end_events = []
+        for alert in alerts:
+            alert.end = end_time
+            alert.active = None
+
+            end_event = alert.end_event()
+            if end_event:
+                # Events are alerts with no duration, see register_event
+                end_event.alert_type = end_event.__class__.__name__
+                end_event.begin = end_time
+                end_event.end = end_time
+                end_event._message = end_event.alert_message()
+                end_events.append(end_event)
+
+        cls.objects.filter(id__in=active_ids, active=True).update(end=end_time, active=None)
+        AlertState.objects.bulk_create(end_events, batch_size=500)
+
+        return end_events
+
     def cast(self, target_class):
         """
         Works exactly as the super except because we duplicate record_type with alert_type. We should remove in the
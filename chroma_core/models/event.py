@@ -3,6 +3,8 @@
 # license that can be found in the LICENSE file.
 
 
+from iml_common.lib import util
+
 from chroma_core.models.alert import AlertStateBase, AlertState
 from chroma_core.models.sparse_model import VariantGenericForeignKey, VariantDescriptor
 
@@ -33,17 +35,27 @@ class LearnEvent(AlertStateBase):
         app_label = "chroma_core"
         proxy = True
 
-    @staticmethod
-    def type_name():
-        return "Autodetection"
+    type_name = "Autodetection"
+
+    # Message formats keyed by the model of the learned item, built on first use because the target models cannot
+    # be imported while this module is loading.
+    _learned_item_formats = None
+
+    @classmethod
+    def _get_learned_item_formats(cls):
+        if cls._learned_item_formats is None:
+            from chroma_core.models import ManagedTarget
+
+            target_classes = [ManagedTarget] + util.all_subclasses(ManagedTarget)
+            cls._learned_item_formats = dict((klass, "Discovered formatted target %s") for klass in target_classes)
+
+        return cls._learned_item_formats
 
     def alert_message(self):
-        from chroma_core.models import ManagedTarget
+        learned_item = self.learned_item
+        model = learned_item._meta.concrete_model if learned_item is not None else None
 
-        if isinstance(self.learned_item, ManagedTarget):
-            return "Discovered formatted target %s" % self.learned_item
-        else:
-            return "Discovered %s" % self.learned_item
+        return self._get_learned_item_formats().get(model, "Discovered %s") % learned_item
 
 
 class AlertEvent(AlertStateBase):
@@ -62,9 +74,7 @@ class AlertEvent(AlertStateBase):
         ),
     ]
 
-    @staticmethod
-    def type_name():
-        return "Alert"
+    type_name = "Alert"
 
     def alert_message(self):
         return self.message_str
@@ -77,9 +87,7 @@ class SyslogEvent(AlertStateBase):
         app_label = "chroma_core"
         proxy = True
 
-    @staticmethod
-    def type_name():
-        return "Syslog"
+    type_name = "Syslog"
 
     def alert_message(self):
         return self.message_str
@@ -95,6 +103,4 @@ class ClientConnectEvent(AlertStateBase):
     def alert_message(self):
         return self.message_str
 
-    @staticmethod
-    def type_name():
-        return "ClientConnect"
+    type_name = "ClientConnect"
@@ -44,7 +44,6 @@ from chroma_core.lib.job import DependAll
 from chroma_core.lib.job import DependAny
 from chroma_core.lib.job import Step
 from chroma_core.models.utils import DeletableMetaclass
-from chroma_core.models.utils import get_all_sub_classes
 from chroma_help.help import help_text
 from chroma_core.services.job_scheduler import job_scheduler_notify
 from iml_common.lib.util import ExceptionThrowingThread
@@ -858,8 +857,7 @@ class DeleteHostStep(Step):
         AgentRpc.remove(host.fqdn)
 
         # Lower all alerts associated with the host being removed
-        for c in get_all_sub_classes(AlertStateBase):
-            c.notify(host, False)
+        AlertState.end_alerts_bulk(AlertState.filter_by_item(host))
 
         # Lower any time sync alerts for the host
         TimeOutOfSyncAlert.notify(host, False)
@@ -1436,9 +1434,7 @@ class HostRebootEvent(AlertStateBase):
         app_label = "chroma_core"
         proxy = True
 
-    @staticmethod
-    def type_name():
-        return "Autodetection"
+    type_name = "Autodetection"
 
     def alert_message(self):
         return "%s restarted at %s" % (self.alert_item, self.begin)
@@ -7,6 +7,7 @@ import logging
 
 from django.db import models
 from django.db.models import CASCADE
+from django.utils.timezone import now as tznow
 from chroma_core.models import AlertStateBase
 from chroma_core.models import AlertEvent
 from chroma_core.models import DeletableStatefulObject
@@ -15,6 +16,7 @@ from chroma_core.models import Job
 from chroma_core.models import SchedulingError
 from chroma_core.models import StateLock
 from chroma_core.lib.job import DependOn, DependAll, Step
+from chroma_core.services.job_scheduler import job_scheduler_notify
 from chroma_help.help import help_text
 
 
@@ -46,37 +48,43 @@ class PacemakerConfiguration(DeletableStatefulObject):
 
     reverse_deps = {"ManagedHost": lambda mh: PacemakerConfiguration.objects.filter(host_id=mh.id)}
 
-    # Below the handler should be in a completion hook, but I can't see how to get the instance of the completion
-    # hook to add it and time is running out. I will return to this.
+    # The job scheduler's completion hook configures fencing when a notification sets reconfigure_fencing.
 
     @property
     def reconfigure_fencing(self):
-        # We return False because we are overloading the attribute setter below to make it a event handler rather than
-        # a real property. If some sets reconfigure_fencing = False then the event will not be called because the current
-        # value is always False. If someone sets reconfigure_fencing = True then the setter will be called because the
-        # current value is always False!
+        # Always False so that a notification setting reconfigure_fencing = True is never dropped as already set,
+        # even if a previous notification failed part way through and left the cached instance behind.
         return False
 
     @reconfigure_fencing.setter
     def reconfigure_fencing(self, ignored_value):
-        # We don't store this because we are overloading the attribute setter below to make it a event handler rather than
-        # a real property.
+        # Not stored, the notification itself is the event.
         pass
 
+    def request_reconfigure_fencing(self):
+        """
+        Ask the job scheduler to reconfigure the fencing agents on this host.
+        """
+        job_scheduler_notify.notify(self, tznow(), {"reconfigure_fencing": True})
+
 
 class StonithNotEnabledAlert(AlertStateBase):
     default_severity = logging.ERROR
 
+    # Message formats resolved once rather than looked up in help_text for every message
+    alert_message_format = help_text["stonith_not_enabled"]
+    end_event_message_format = help_text["stonith_enabled"]
+
     class Meta:
         app_label = "chroma_core"
         proxy = True
 
     def alert_message(self):
-        return help_text["stonith_not_enabled"] % self.alert_item
+        return self.alert_message_format % self.alert_item
 
     def end_event(self):
         return AlertEvent(
-            message_str=help_text["stonith_enabled"] % self.alert_item,
+            message_str=self.end_event_message_format % self.alert_item,
             alert_item=self.alert_item,
             alert=self,
             severity=logging.INFO,
@@ -120,6 +128,16 @@ class PacemakerStoppedAlert(AlertStateBase):
         return [self.alert_item.host]
 
 
+class PacemakerStateChangeJob(StateChangeJob):
+    """A StateChangeJob which changes the state of a PacemakerConfiguration"""
+
+    stateful_object = "pacemaker_configuration"
+    pacemaker_configuration = models.ForeignKey(PacemakerConfiguration, on_delete=CASCADE)
+
+    class Meta:
+        abstract = True
+
+
 class ConfigurePacemakerStep(Step):
     idempotent = True
 
@@ -128,10 +146,8 @@ class ConfigurePacemakerStep(Step):
         self.invoke_agent_expect_result(host, "configure_pacemaker")
 
 
-class ConfigurePacemakerJob(StateChangeJob):
+class ConfigurePacemakerJob(PacemakerStateChangeJob):
     state_transition = StateChangeJob.StateTransition(PacemakerConfiguration, "unconfigured", "stopped")
-    stateful_object = "pacemaker_configuration"
-    pacemaker_configuration = models.ForeignKey(PacemakerConfiguration, on_delete=CASCADE)
     state_verb = "Configure Pacemaker"
 
     display_group = Job.JOB_GROUPS.COMMON
@@ -183,10 +199,8 @@ class UnconfigurePacemakerStep(Step):
         self.invoke_agent_expect_result(host, "unconfigure_pacemaker")
 
 
-class UnconfigurePacemakerJob(StateChangeJob):
+class UnconfigurePacemakerJob(PacemakerStateChangeJob):
     state_transition = StateChangeJob.StateTransition(PacemakerConfiguration, "stopped", "unconfigured")
-    stateful_object = "pacemaker_configuration"
-    pacemaker_configuration = models.ForeignKey(PacemakerConfiguration, on_delete=CASCADE)
     state_verb = "Unconfigure Pacemaker"
 
     display_group = Job.JOB_GROUPS.COMMON
@@ -233,7 +247,7 @@ class UnconfigurePacemakerJob(StateChangeJob):
         from chroma_core.models.target import get_host_targets
 
         for t in get_host_targets(self.pacemaker_configuration.host.id):
-            deps.append(DependOn(target, "removed"))
+            deps.append(DependOn(t, "removed"))
 
         return DependAll(deps)
 
@@ -244,9 +258,9 @@ class UnconfigurePacemakerJob(StateChangeJob):
         :param instance: PacemakerConfiguration instance being queried
         :return: True if no target exist on the host in question.
         """
-        from chroma_core.models.target import get_host_targets
+        from chroma_core.models.target import host_has_targets
 
-        return len(get_host_targets(instance.host.id)) == 0
+        return not host_has_targets(instance.host_id)
 
 
 class StartPacemakerStep(Step):
@@ -260,10 +274,8 @@ class StartPacemakerStep(Step):
         return help_text["start_pacemaker_on"] % kwargs["host"].fqdn
 
 
-class StartPacemakerJob(StateChangeJob):
+class StartPacemakerJob(PacemakerStateChangeJob):
     state_transition = StateChangeJob.StateTransition(PacemakerConfiguration, "stopped", "started")
-    stateful_object = "pacemaker_configuration"
-    pacemaker_configuration = models.ForeignKey(PacemakerConfiguration, on_delete=CASCADE)
     state_verb = "Start Pacemaker"
 
     display_group = Job.JOB_GROUPS.COMMON
@@ -298,10 +310,8 @@ class StopPacemakerStep(Step):
         return help_text["stop_pacemaker_on"] % kwargs["host"].fqdn
 
 
-class StopPacemakerJob(StateChangeJob):
+class StopPacemakerJob(PacemakerStateChangeJob):
     state_transition = StateChangeJob.StateTransition(PacemakerConfiguration, "started", "stopped")
-    stateful_object = "pacemaker_configuration"
-    pacemaker_configuration = models.ForeignKey(PacemakerConfiguration, on_delete=CASCADE)
     state_verb = "Stop Pacemaker"
 
     display_group = Job.JOB_GROUPS.RARE
@@ -330,9 +340,16 @@ class GetPacemakerStateStep(Step):
     database = True
 
     def run(self, kwargs):
+        from chroma_core.models import ManagedHost
         from chroma_core.services.job_scheduler.agent_rpc import AgentException
 
-        host = kwargs["host"]
+        # Only the fields needed to contact the host and update its state. The content type is joined in because
+        # the polymorphic save() checks it, which would otherwise cost a query of its own.
+        host = (
+            ManagedHost.objects.select_related("content_type")
+            .only("id", "fqdn", "state", "state_modified_at", "content_type")
+            .get(pk=kwargs["host_id"])
+        )
 
         try:
             lnet_data = self.invoke_agent(host, "device_plugin", {"plugin": "linux_network"})["linux_network"]["lnet"]
@@ -358,7 +375,7 @@ class GetPacemakerStateJob(Job):
 
     @classmethod
     def get_args(cls, pacemaker_configuration):
-        return {"host": pacemaker_configuration.host}
+        return {"host_id": pacemaker_configuration.host_id}
 
     @classmethod
     def long_description(cls, stateful_object):
@@ -368,7 +385,7 @@ class GetPacemakerStateJob(Job):
         return "Get Pacemaker state for %s" % self.pacemaker_configuration.host
 
     def get_steps(self):
-        return [(GetPacemakerStateStep, {"host": self.pacemaker_configuration.host})]
+        return [(GetPacemakerStateStep, {"host_id": self.pacemaker_configuration.host_id})]
 
 
 class ConfigureHostFencingJob(Job):
@@ -419,7 +436,7 @@ class ConfigureHostFencingStep(Step):
             )
 
         agent_kwargs = []
-        for outlet in host.outlets.select_related().all():
+        for outlet in host.outlets.select_related("device__device_type"):
             fence_kwargs = {
                 "agent": outlet.device.device_type.agent,
                 "login": outlet.device.username,
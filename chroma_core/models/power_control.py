@@ -12,7 +12,6 @@ from django.db.models.signals import post_save, post_delete, pre_delete
 from django.dispatch import receiver
 from django.core.exceptions import ValidationError
 from django.template.defaultfilters import pluralize
-from django.utils.timezone import now as tznow
 
 from iml_common.lib.util import platform_info
 from chroma_core.models.alert import AlertStateBase
@@ -20,7 +19,6 @@ from chroma_core.models.event import AlertEvent
 from chroma_core.models.host import ManagedHost
 from chroma_core.models.jobs import Job, AdvertisedJob, job_log
 from chroma_core.models.utils import DeletableMetaclass
-from chroma_core.services.job_scheduler import job_scheduler_notify
 from chroma_help.help import help_text
 
 from chroma_core.lib.job import Step
@@ -417,11 +415,10 @@ class PowerControlDeviceOutlet(DeletablePowerControlModel):
 
         super(PowerControlDeviceOutlet, self).save(*args, **kwargs)
 
-        reconfigure = {"reconfigure_fencing": True}
         previous = old_self.host if old_self else None
         for host in self._hosts_for_fence_reconfiguration(self.host, previous):
             if host.pacemaker_configuration:
-                job_scheduler_notify.notify(host.pacemaker_configuration, tznow(), reconfigure)
+                host.pacemaker_configuration.request_reconfigure_fencing()
             else:
                 job_log.debug("Skipping reconfiguration of non-server %s" % host)
 
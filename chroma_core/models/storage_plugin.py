@@ -355,9 +355,7 @@ class StorageResourceLearnEvent(AlertStateBase):
         )
     ]
 
-    @staticmethod
-    def type_name():
-        return "Storage resource detection"
+    type_name = "Storage resource detection"
 
     def alert_message(self):
         from chroma_core.lib.storage_plugin.query import ResourceQuery
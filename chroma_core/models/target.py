@@ -764,6 +764,10 @@ def get_host_targets(host_id):
     return ManagedTarget.objects.filter(uuid__in=xs, not_deleted=True)
 
 
+def host_has_targets(host_id):
+    return get_host_targets(host_id).exists()
+
+
 def get_target_by_name(name):
     from chroma_core.lib.graphql import get_targets
 
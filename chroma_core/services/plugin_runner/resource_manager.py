@@ -1054,7 +1054,7 @@ class ResourceManager(object):
         for record_id in phase1_ordered_dependencies:
             collect_phase2(record_id)
 
-        for storage_resource_record in StorageResourceLearnEvent.objects.all():
+        for storage_resource_record in StorageResourceLearnEvent.objects.order_by():
             if storage_resource_record.storage_resource.id in ordered_for_deletion:
                 storage_resource_record.delete()
 
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from django.db import models
 from django.db.models import CASCADE
 from django.db.models.base import ModelBase
@@ -110,5 +112,45 @@ class DowncastQuerySet(QuerySet):
             return result
 
     def __iter__(self):
-        for item in super(DowncastQuerySet, self).__iter__():
-            yield item.downcast()
+        for item in downcast_all(super(DowncastQuerySet, self).__iter__(), self.db):
+            yield item
+
+
+def downcast_all(instances, using=None):
+    """Downcast a sequence of instances with one query per concrete subclass
+
+    Calling downcast() on each instance costs a query per instance to fetch its
+    subclass row. Instead group the instances whose subclass row is not yet
+    cached by their concrete class, fetch the rows for each class with a single
+    in_bulk() and store each row in the reverse one-to-one cache that
+    downcast() reads. Downcasting the same instances again then costs no
+    queries and returns the same objects.
+
+    Returns a list of the downcast instances in the order given.
+    """
+    instances = list(instances)
+
+    uncached_by_model = defaultdict(list)
+    for instance in instances:
+        model = instance.downcast_class
+        if model != instance.__class__:
+            cache_name = _downcast_cache_name(instance.__class__, model)
+            if cache_name and not hasattr(instance, cache_name):
+                uncached_by_model[model].append(instance)
+
+    for model, uncached in uncached_by_model.items():
+        cache_name = _downcast_cache_name(uncached[0].__class__, model)
+        downcasts = model._base_manager.using(using).in_bulk([instance.pk for instance in uncached])
+        for instance in uncached:
+            if instance.pk in downcasts:
+                setattr(instance, cache_name, downcasts[instance.pk])
+
+    # Anything in_bulk() did not return is left for downcast() to look up as before.
+    return [instance.downcast() for instance in instances]
+
+
+def _downcast_cache_name(klass, model):
+    """Name of the attribute caching the model row on a klass instance, or None if klass has no accessor for it"""
+    related = getattr(getattr(klass, model.__name__.lower(), None), "related", None)
+
+    return related.get_cache_name() if related is not None else None
@@ -0,0 +1,22 @@
+import mock
+
+from tests.unit.chroma_core.jobs.test_jobs import TestJobs
+
+from chroma_core.models import GetPacemakerStateJob, GetPacemakerStateStep, ManagedHost
+
+
+class TestGetPacemakerStateJob(TestJobs):
+    def test_get_pacemaker_state_step(self):
+        job = GetPacemakerStateJob(pacemaker_configuration=self.host.pacemaker_configuration)
+        steps = job.get_steps()
+        self.assertEqual(steps, [(GetPacemakerStateStep, {"host_id": self.host.id})])
+
+        lnet_data = {"linux_network": {"lnet": {"state": "lnet_down"}}}
+
+        with mock.patch.object(GetPacemakerStateStep, "invoke_agent", return_value=lnet_data) as invoke_agent:
+            # Fetch the host, check its fqdn is unique and update its state
+            with self.assertNumQueries(3):
+                self.run_step(job, steps[0])
+
+        self.assertEqual(invoke_agent.call_args[0][0].fqdn, self.host.fqdn)
+        self.assertEqual(ManagedHost.objects.get(pk=self.host.id).state, "lnet_down")
@@ -1,8 +1,15 @@
+from django.utils import timezone
+
 from tests.unit.lib.iml_unit_test_case import IMLUnitTestCase
+from tests.unit.chroma_core.helpers import load_default_profile, synthetic_host
 
 from chroma_core.models import CommandRunningAlert
 from chroma_core.models import CommandCancelledAlert
+from chroma_core.models import AlertEvent
 from chroma_core.models import AlertState
+from chroma_core.models import PacemakerStoppedAlert
+from chroma_core.models import StonithNotEnabledAlert
+from chroma_help.help import help_text
 
 
 class TestAlert(IMLUnitTestCase):
@@ -24,3 +31,38 @@ class TestAlert(IMLUnitTestCase):
         alerts = AlertState.objects.all()
         self.assertEqual(len(alerts), 1)
         self.assertEqual(alerts[0].message(), "Command Houston we have a problem cancelled")
+
+    def test_end_alerts_bulk(self):
+        load_default_profile()
+        pacemaker_configurations = [synthetic_host("myserver%s" % index).pacemaker_configuration for index in range(3)]
+        alerts = [StonithNotEnabledAlert.notify(pc, True) for pc in pacemaker_configurations]
+        alert_ids = [alert.id for alert in alerts]
+        events_before = AlertEvent.objects.count()
+        end_time = timezone.now()
+
+        # Alerts of another class are left alone.
+        self.assertEqual(PacemakerStoppedAlert.end_alerts_bulk(alerts, end_time=end_time), [])
+        self.assertEqual(AlertState.objects.filter(id__in=alert_ids, active=True).count(), len(alerts))
+
+        # One query to find the active alerts, one to lower them and one to insert the end events.
+        with self.assertNumQueries(3):
+            StonithNotEnabledAlert.end_alerts_bulk((alert for alert in alerts), end_time=end_time)
+
+        for alert in AlertState.objects.filter(id__in=alert_ids):
+            self.assertEqual(alert.active, None)
+            self.assertEqual(alert.end, end_time)
+
+        end_events = list(AlertEvent.objects.order_by("id"))[events_before:]
+        self.assertEqual(len(end_events), len(alerts))
+        for alert, pacemaker_configuration, end_event in zip(alerts, pacemaker_configurations, end_events):
+            self.assertEqual(end_event.message_str, help_text["stonith_enabled"] % pacemaker_configuration)
+            self.assertEqual(end_event.alert.id, alert.id)
+            self.assertEqual(end_event.active, None)
+            self.assertEqual(end_event.begin, end_time)
+            self.assertEqual(end_event.end, end_time)
+
+        # Alerts that have already been lowered are left alone.
+        self.assertEqual(StonithNotEnabledAlert.end_alerts_bulk(alerts, end_time=timezone.now()), [])
+        self.assertEqual(AlertEvent.objects.count(), events_before + len(alerts))
+        for alert in AlertState.objects.filter(id__in=alert_ids):
+            self.assertEqual(alert.end, end_time)
@@ -0,0 +1,31 @@
+from chroma_core.models import Job, RebootHostJob, ShutdownHostJob
+from tests.unit.chroma_core.helpers import load_default_profile, synthetic_host
+from tests.unit.lib.iml_unit_test_case import IMLUnitTestCase
+
+
+class TestDowncastQuerySet(IMLUnitTestCase):
+    def setUp(self):
+        super(TestDowncastQuerySet, self).setUp()
+
+        load_default_profile()
+        host = synthetic_host("myserver")
+
+        self.job_classes = [RebootHostJob, ShutdownHostJob] * 3
+        self.job_ids = [job_class.objects.create(host=host).id for job_class in self.job_classes]
+
+    def test_iterate_mixed_subclasses(self):
+        jobs = Job.objects.filter(id__in=self.job_ids).order_by("id")
+
+        # One query for the Job rows and one for each concrete subclass.
+        with self.assertNumQueries(3):
+            downcast_jobs = list(jobs)
+
+        self.assertEqual([type(job) for job in downcast_jobs], self.job_classes)
+
+        # The subclass rows are cached, so iterating again or indexing costs nothing and gives the same objects.
+        with self.assertNumQueries(0):
+            for job, downcast_job in zip(jobs, downcast_jobs):
+                self.assertIs(job, downcast_job)
+
+            for index, downcast_job in enumerate(downcast_jobs):
+                self.assertIs(jobs[index], downcast_job)
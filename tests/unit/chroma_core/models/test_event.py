@@ -0,0 +1,25 @@
+from chroma_core.models import LearnEvent
+from tests.unit.chroma_core.helpers import create_simple_fs, load_default_profile, synthetic_host
+from tests.unit.lib.iml_unit_test_case import IMLUnitTestCase
+
+
+class TestLearnEvent(IMLUnitTestCase):
+    def setUp(self):
+        super(TestLearnEvent, self).setUp()
+
+        load_default_profile()
+
+    def test_alert_message(self):
+        host = synthetic_host("myserver")
+
+        LearnEvent.register_event(host, learned_item=host)
+
+        self.assertEqual(LearnEvent.objects.get().message(), "Discovered %s" % host)
+
+    def test_target_alert_message(self):
+        host = synthetic_host("myserver")
+        (mgt, fs, mdt, ost) = create_simple_fs()
+
+        LearnEvent.register_event(host, learned_item=mgt)
+
+        self.assertEqual(LearnEvent.objects.get().message(), "Discovered formatted target %s" % mgt)
@@ -8,7 +8,8 @@ from chroma_core.services.job_scheduler.job_scheduler_client import JobScheduler
 from chroma_api.urls import api
 from tests.unit.chroma_core.helpers import MockAgentRpc
 from tests.unit.chroma_core.helpers import synthetic_host, synthetic_volume_full
-from chroma_core.models.host import ManagedHost, Volume, VolumeNode
+from chroma_core.models import AlertEvent, AlertState
+from chroma_core.models.host import HostContactAlert, ManagedHost, Volume, VolumeNode
 from chroma_core.models.lnet_configuration import Nid
 from tests.unit.services.job_scheduler.job_test_case import JobTestCase
 
@@ -45,6 +46,8 @@ class TestHostAddRemove(JobTestCase):
         self.assertEqual(Volume.objects.count(), 1)
         self.assertEqual(VolumeNode.objects.count(), 1)
 
+        alert = HostContactAlert.notify(host, True)
+
         # The host disappears, never to be seen again
         MockAgentRpc.succeed = False
         try:
@@ -61,6 +64,11 @@ class TestHostAddRemove(JobTestCase):
         self.assertEqual(Volume.objects.count(), 0)
         self.assertEqual(VolumeNode.objects.count(), 0)
 
+        # Alerts on the host are lowered with their end events recorded
+        self.assertEqual(AlertState.objects.get(pk=alert.pk).active, None)
+        events = AlertEvent.objects.filter(alert_item_id=host.id, alert_item_type=host.content_type)
+        self.assertIn("Re-established contact with host %s" % host, [event.message_str for event in events])
+
     def test_force_removal_with_filesystem(self):
         """Test that when a filesystem depends on a host, the filesystem
         is deleted along with the host when doing a force remove"""
@@ -8,6 +8,8 @@ from chroma_core.models.jobs import SchedulingError, Job
 from chroma_core.models.command import Command
 from chroma_core.models import ManagedMgs, ManagedTarget
 from chroma_core.models import LNetConfiguration
+from chroma_core.models import ConfigureHostFencingJob
+from chroma_core.models import PowerControlType, PowerControlDevice
 from chroma_core.services.job_scheduler.job_scheduler import RunJobThread
 from chroma_core.services.job_scheduler import job_scheduler_notify
 from chroma_core.services.job_scheduler.job_scheduler_client import JobSchedulerClient
@@ -263,3 +265,19 @@ class TestStateManager(JobTestCaseWithHost):
         finally:
             RunJobThread.cancel = cancel_bak
             JobScheduler._spawn_job = spawn_bak
+
+
+class TestFencingReconfiguration(JobTestCaseWithHost):
+    def test_outlet_changes(self):
+        """Test that every outlet change on a host configures fencing, not just the first"""
+        fence_type = PowerControlType.objects.create(
+            agent="fake_agent", max_outlets=2, default_username="fake", default_password="fake"
+        )
+        with mock.patch("chroma_core.services.power_control.rpc.PowerControlRpc"):
+            pdu = PowerControlDevice.objects.create(device_type=fence_type, address="localhost")
+
+        for outlet in pdu.outlets.order_by("identifier"):
+            outlet.host = self.host
+            outlet.save()
+
+        self.assertEqual(ConfigureHostFencingJob.objects.filter(host=self.host).count(), 2)
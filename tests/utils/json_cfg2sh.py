@@ -1,51 +1,66 @@
 import json
 import sys
 
-f = open(sys.argv[1])
-config = json.load(f)
-f.close()
 
-servers = []
-workers = []
-all_nodes = []
-for server in config["lustre_servers"]:
-    if server.get("profile") and server["profile"] == "posix_copytool_worker":
-        workers.append(server["address"])
-    else:
-        servers.append(server["address"])
-    all_nodes.append(server["address"])
+def main(argv):
+    f = open(argv[1])
+    config = json.load(f)
+    f.close()
 
-if len(config["chroma_managers"]) > 0:
-    chroma_manager = config["chroma_managers"][0]
+    chroma_managers = config["chroma_managers"]
+    lustre_clients = config.get("lustre_clients")
+    test_runners = config.get("test_runners")
 
-    all_nodes.insert(0, chroma_manager["address"])
-    print('CHROMA_MANAGER="%s"' % chroma_manager["address"])
+    servers = []
+    workers = []
+    all_nodes = []
+    for server in config["lustre_servers"]:
+        address = server["address"]
+        if server.get("profile") == "posix_copytool_worker":
+            workers.append(address)
+        else:
+            servers.append(address)
+        all_nodes.append(address)
 
-    user = chroma_manager["users"][0]
-    print('CHROMA_USER="%s"' % user["username"])
-    print('CHROMA_PASS="%s"' % user["password"])
+    if len(chroma_managers) > 0:
+        chroma_manager = chroma_managers[0]
+        chroma_manager_address = chroma_manager["address"]
 
-    if user.get("email"):
-        print('CHROMA_EMAIL="%s"' % user["email"])
+        all_nodes.insert(0, chroma_manager_address)
+        print('CHROMA_MANAGER="%s"' % chroma_manager_address)
 
-    if chroma_manager.get("ntp_server"):
-        print('CHROMA_NTP_SERVER="%s"' % chroma_manager["ntp_server"])
+        user = chroma_manager["users"][0]
+        print('CHROMA_USER="%s"' % user["username"])
+        print('CHROMA_PASS="%s"' % user["password"])
 
-print("STORAGE_APPLIANCES=(%s)" % " ".join(servers))
-print("WORKERS=(%s)" % " ".join(workers))
+        if user.get("email"):
+            print('CHROMA_EMAIL="%s"' % user["email"])
 
-if config.get("lustre_clients"):
-    print('CLIENT_1="%s"' % config["lustre_clients"][0]["address"])
-    all_nodes.append(config["lustre_clients"][0]["address"])
+        if chroma_manager.get("ntp_server"):
+            print('CHROMA_NTP_SERVER="%s"' % chroma_manager["ntp_server"])
 
-if config.get("test_runners"):
-    print('TEST_RUNNER="%s"' % config["test_runners"][0]["address"])
-    all_nodes.append(config["test_runners"][0]["address"])
+    print("STORAGE_APPLIANCES=(%s)" % " ".join(servers))
+    print("WORKERS=(%s)" % " ".join(workers))
 
-print(
-    'HOST_IP="%s"' % config["hosts"].values()[0]["ip_address"]
-)  # This will have to change in case cluster has multiple hosts for VMs, but an adequate placeholder for this version of the prototype.
+    if lustre_clients:
+        client_address = lustre_clients[0]["address"]
+        print('CLIENT_1="%s"' % client_address)
+        all_nodes.append(client_address)
 
-print('ALL_NODES="%s"' % " ".join(list(set(all_nodes))))
+    if test_runners:
+        test_runner_address = test_runners[0]["address"]
+        print('TEST_RUNNER="%s"' % test_runner_address)
+        all_nodes.append(test_runner_address)
 
-print('INSTALLER_PATH="%s"' % config.get("installer_path", "/tmp"))
+    first_host = next(iter(config["hosts"].values()))
+    print(
+        'HOST_IP="%s"' % first_host["ip_address"]
+    )  # This will have to change in case cluster has multiple hosts for VMs, but an adequate placeholder for this version of the prototype.
+
+    print('ALL_NODES="%s"' % " ".join(list(set(all_nodes))))
+
+    print('INSTALLER_PATH="%s"' % config.get("installer_path", "/tmp"))
+
+
+if __name__ == "__main__":
+    main(sys.argv)